@@ -38,48 +38,22 @@ from ._internal import (
     clone, 
     pretty_repr, 
 )
-import sys
 
-class Module:
-    """Module class for Data package."""
-
-    # Dynamic attribute access and provision
-    def __getattr__(self, name: str):
-        match name:
-            case "Data":
-                return Data
-            case "FrozenData":
-                return FrozenData
-            case "data_factory":
-                return data_factory
-            case "is_data_factory":
-                return is_data_factory
-            case "field":
-                return field
-            case "computed_field":
-                return computed_field
-            case "make_data_factory":
-                return make_data_factory
-            case "validate_data":
-                return validate_data
-            case "inspect_data":
-                return inspect_data
-            case "patch_data":
-                return patch_data
-            case "diff_data":
-                return diff_data
-            case "sync_data":
-                return sync_data
-            case "to_schema":
-                return to_schema
-            case "diff_schema":
-                return diff_schema
-            case "clone":
-                return clone
-            case "pretty_repr":
-                return pretty_repr
-            case "Module":
-                return Module
-        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
-
-sys.modules[__name__] = Module()
\ No newline at end of file
+__all__ = (
+    "Data", 
+    "FrozenData", 
+    "data_factory", 
+    "is_data_factory", 
+    "make_data_factory", 
+    "field", 
+    "computed_field", 
+    "validate_data", 
+    "inspect_data", 
+    "patch_data", 
+    "diff_data", 
+    "sync_data", 
+    "to_schema", 
+    "diff_schema", 
+    "clone", 
+    "pretty_repr", 
+)
\ No newline at end of file
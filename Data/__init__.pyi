@@ -1,4 +1,3 @@
-from typing import Type, Callable, Any
 from ._internal import (
     Data, 
     FrozenData, 
@@ -18,28 +17,6 @@ from ._internal import (
     pretty_repr, 
 )
 
-CallableUtility = Callable[(...), Any]
-DataFactoryDecorator = Callable[(...), Any]
-
-class Module: 
-    # Basic Type defintions
-    Data: Type[Data]
-    FrozenData: Type[FrozenData]
-    data_factory: DataFactoryDecorator
-    is_data_factory: CallableUtility
-    make_data_factory: CallableUtility
-    field: CallableUtility
-    computed_field: CallableUtility
-    validate_data: CallableUtility
-    inspect_data: CallableUtility
-    patch_data: CallableUtility
-    diff_data: CallableUtility
-    sync_data: CallableUtility
-    to_schema: CallableUtility
-    diff_schema: CallableUtility
-    clone: CallableUtility
-    pretty_repr: CallableUtility
-
 __all__ = (
     'Data', 
     'FrozenData', 
@@ -57,5 +34,4 @@ __all__ = (
     'diff_schema', 
     'clone', 
     'pretty_repr', 
-    'Module',
 )
\ No newline at end of file
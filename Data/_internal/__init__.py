@@ -21,7 +21,7 @@ __all__ = (
     "data_factory", 
     "is_data_factory", 
     "make_data_factory", 
-    "fields", 
+    "field", 
     "computed_field", 
     "validate_data", 
     "inspect_data", 
@@ -3,89 +3,313 @@
 from typing import (
     Iterable, Set, Tuple, List, Dict, Any, Optional, Type, TypeVar, Generic, 
     Literal, overload, KeysView, ValuesView, ItemsView, Union, Callable, Self,
-    FrozenSet, get_origin, get_args
+    Mapping, Collection, FrozenSet, get_origin, get_args
 )
 from .fields import Field, ComputedField
 from .meta import DataMeta
+from collections.abc import Callable as AbcCallable
+from types import UnionType, MappingProxyType
+from functools import lru_cache
 import os
-import json
 
 V = TypeVar("V", default=Any)
 DictSchema = Dict[str, V]
 
+_MISSING = object() # Sentinel for absent content keys
+_COPY_ON_WRITE = object() # __original__ inside a with-block that has not written yet
+
+# Builtin types that are never a Field or Data. Resolution checks type(value) against
+# these first, since isinstance(value, Data) goes through ABCMeta and is slow.
+_PLAIN_TYPES: FrozenSet[type] = frozenset((str, int, float, bool, complex, bytes, type(None), list, dict, tuple, set, frozenset))
+
+TypeCheck = Callable[[Any], bool]
+
+def _always(value: Any) -> bool:
+    return True
+
+def _annotations_of(cls: type) -> Dict[str, Any]:
+    """A class's own annotations, read from its __dict__ before falling back to the attribute lookup."""
+    return cls.__dict__.get("__annotations__") or getattr(cls, "__annotations__", {})
+
+# Compiled checkers shared by every class, keyed by annotation (List[int] etc. compare equal).
+# Bounded, since Data classes used as annotations (even runtime-built ones) would otherwise be kept forever.
+@lru_cache(maxsize=1024)
+def _cached_check(annotation: Any) -> TypeCheck:
+    return _compile_check(annotation)
+
+def _get_check(annotation: Any) -> TypeCheck:
+    """Return the cached checker for annotation, compiling it on first use."""
+    try:
+        return _cached_check(annotation)
+    except TypeError: # Unhashable annotation, compile without caching
+        return _compile_check(annotation)
+
+def _compile_check(annotation: Any) -> TypeCheck:
+    """
+    Resolve a typing annotation once into a checker closure.
+
+    get_origin/get_args are only consulted here, so checking a value afterwards
+    is a plain function call instead of a walk through typing internals.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    # Simple/Non-Generic Types (origin is None)
+    if origin is None:
+        if annotation is Any or isinstance(annotation, TypeVar):
+            return _always
+        if annotation is type(None):
+            return lambda value: value is None
+        if isinstance(annotation, type):
+            return lambda value: isinstance(value, annotation)
+        def check_loose(value: Any) -> bool:
+            try:
+                return isinstance(value, annotation)
+            except TypeError:
+                # Not a usable class (e.g. a string forward reference)
+                return True
+        return check_loose
+
+    # Generic origins (List, Dict, Union, ...) dispatch on their runtime origin
+    compile_origin = _ORIGIN_COMPILERS.get(origin)
+    if compile_origin is not None:
+        return compile_origin(origin, args)
+
+    # Fallback for Generic Subclasses (like Data[Gene]): only the origin is checked
+    def check_origin(value: Any) -> bool:
+        try:
+            return isinstance(value, origin)
+        except TypeError:
+            # Origins that are not usable with isinstance
+            return True
+    return check_origin
+
+def _plain_classes(annotation: Any) -> Optional[Tuple[type, ...]]:
+    """The classes a plain class or a Union of plain classes accepts, else None (needs a checker)."""
+    if type(annotation) is type:
+        return (annotation,)
+    origin = get_origin(annotation)
+    if origin is Union or origin is UnionType:
+        args = get_args(annotation)
+        if all(type(arg) is type for arg in args):
+            return args
+    return None
+
+def _compile_union(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    # Union (including Optional and PEP 604 unions)
+    if all(type(arg) is type for arg in args):
+        # Optional[str], Union[int, float], ...: one isinstance over the class tuple
+        return lambda value: isinstance(value, args)
+    options = tuple(_get_check(arg) for arg in args)
+    return lambda value: any(check(value) for check in options)
+
+def _compile_literal(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    try:
+        values = frozenset(args)
+    except TypeError: # Unhashable literal values, keep the tuple scan
+        return lambda value: value in args
+    def check_literal(value: Any) -> bool:
+        try:
+            return value in values
+        except TypeError: # Unhashable value, which no hashable literal can equal
+            return False
+    return check_literal
+
+def _compile_callable(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    # Checking the signature is complex, so only check callability
+    return callable
+
+def _compile_type(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    # Type/type (Type[T] or type[T])
+    if not args or args[0] is Any:
+        return lambda value: isinstance(value, type)
+    target = args[0]
+    targets = get_args(target) if get_origin(target) is Union else (target,)
+    return lambda value: isinstance(value, type) and issubclass(value, targets)
+
+def _compile_collection(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    # List, Set, FrozenSet
+    if not args:
+        return lambda value: isinstance(value, origin)
+    items_check = _compile_items_check(args[0])
+    return lambda value: isinstance(value, origin) and items_check(value)
+
+def _compile_tuple(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    if not args:
+        return lambda value: isinstance(value, tuple)
+    if len(args) == 2 and args[1] is Ellipsis: # Variable length Tuple[T, ...]
+        items_check = _compile_items_check(args[0])
+        return lambda value: isinstance(value, tuple) and items_check(value)
+    # Fixed-length tuple (e.g., Tuple[int, str])
+    item_checks = tuple(_get_check(arg) for arg in args)
+    size = len(item_checks)
+    return lambda value: (isinstance(value, tuple) and len(value) == size
+                          and all(check(item) for check, item in zip(item_checks, value)))
+
+def _compile_dict(origin: Any, args: Tuple[Any, ...]) -> TypeCheck:
+    if len(args) != 2:
+        return lambda value: isinstance(value, dict)
+    key_check, value_check = _get_check(args[0]), _get_check(args[1])
+    return lambda value: isinstance(value, dict) and all(key_check(k) and value_check(v) for k, v in value.items())
+
+# typing aliases share their builtin origin (List[int] -> list), so one entry per origin suffices
+_ORIGIN_COMPILERS: Dict[Any, Callable[[Any, Tuple[Any, ...]], TypeCheck]] = {
+    Union: _compile_union,
+    UnionType: _compile_union,
+    Literal: _compile_literal,
+    AbcCallable: _compile_callable,
+    type: _compile_type,
+    list: _compile_collection,
+    set: _compile_collection,
+    frozenset: _compile_collection,
+    tuple: _compile_tuple,
+    dict: _compile_dict,
+}
+
+def _compile_items_check(annotation: Any) -> Callable[[Collection[Any]], bool]:
+    """Checker for every item of a container against one annotation."""
+    item_check = _get_check(annotation)
+    # Every item goes through isinstance, so objects overriding __class__ (proxies, mocks) are judged as before
+    return lambda items: all(map(item_check, items))
+
+def _field_check_value(field: Field) -> Any:
+    """The value a Field is type checked by: its value, else its default, or _MISSING if required but unset."""
+    value = field.value
+    if value is None:
+        if field.required:
+            return _MISSING
+        value = field.default
+    return value
+
+def _compile_validator(annotations: Dict[str, Any]) -> Callable[[DictSchema], List[str]]:
+    """
+    Generate a straight-line function returning the content keys that fail their annotation.
+
+    Plain classes become inline isinstance tests, everything else calls its compiled checker,
+    so validating a whole instance is one call without a per-key method dispatch.
+    """
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING, "_Field": Field, "_field_value": _field_check_value}
+    lines = ["def validate(content):", "    incorrect = []"]
+    for i, (key, annotation) in enumerate(annotations.items()):
+        classes = _plain_classes(annotation)
+        if classes is not None:
+            namespace[f"t{i}"] = classes
+            test = f"isinstance(v, t{i})"
+        else:
+            namespace[f"c{i}"] = _get_check(annotation)
+            test = f"c{i}(v)"
+        lines += [
+            f"    v = content.get({key!r}, _MISSING)",
+            "    if v is not _MISSING:",
+            "        if isinstance(v, _Field):",
+            "            v = _field_value(v)",
+            f"        if v is _MISSING or not {test}:",
+            f"            incorrect.append({key!r})",
+        ]
+    lines.append("    return incorrect")
+    exec("\n".join(lines), namespace)
+    return namespace["validate"]
+
+def _invalid_field(field: Field) -> bool:
+    """Whether a (non-computed) field fails its validator or is required but unset."""
+    if isinstance(field, ComputedField):
+        return False
+    # Same fallback as type checking: only an unset (None) value defers to the default
+    value = _field_check_value(field)
+    return value is _MISSING or not field.validator(value)
+
 class Data(Generic[V], Iterable, metaclass=DataMeta):
     """A flexible data container class that behaves like both a dictionary and an object with attributes."""
     annotations: Dict[str, Type]
     content: DictSchema
 
-    _meta_cache: Dict[str, Any]
+    _meta_cache: Optional[Dict[str, Any]]
+    _content_cache: Optional[DictSchema]
+    _hash_cache: Optional[int]
+    _revision: int
+    _validation_cache: Optional[Tuple[int, Dict[str, Type], List[str]]]
 
     __frozen__: bool
     __include_methods__: bool
     __auto_cast__: bool
     __strict_typing__: bool
-    __meta_config__: Dict[str, Any]
+    __meta_config__: Mapping[str, Any]
     __fields__: Dict[str, Field]
-    __slots__ = ("content", "annotations", "__frozen__", "__auto_cast__", "__strict_typing__", "__meta_config__", "__fields__", "__original__", "__was_frozen__",) # __weakref__ is already defined in generic
+    __slots__ = ("content", "annotations", "__frozen__", "__auto_cast__", "__strict_typing__", "_meta_cache", "__fields__", "__original__", "__was_frozen__", "__outer_blocks__", "_content_cache", "_hash_cache", "_revision", "_validation_cache",) # __weakref__ is already defined in generic
 
     def __init__(self, value: Optional[DictSchema] = None, frozen: bool = False, include_methods: bool = False, auto_cast: bool = True, strict_typing: bool = True, **kwargs: Any) -> None:
         """Initializes the Data object with optional dictionary content and keyword arguments."""
 
-        prepared_content = {}
-
-        for k, v in (value or {}).items():
-            # Non-field values pass through
-            if not isinstance(v, Field):
-                prepared_content[k] = v
-                continue
-
-            # Skip class fields (static, not instance-linked)
-            if getattr(v, "classfield", False):
+        value = value or {}
+
+        if not any(isinstance(v, Field) for v in value.values()):
+            # Fast path: nothing to copy or link, so merge in a single step
+            prepared_content = {**value, **kwargs}
+            fields = {k: v for k, v in kwargs.items() if isinstance(v, Field)}
+        else:
+            prepared_content = {}
+            fields = {}
+
+            for k, v in value.items():
+                # Non-field values pass through
+                if not isinstance(v, Field):
+                    prepared_content[k] = v
+                    continue
+
+                # Skip class fields (static, not instance-linked)
+                if getattr(v, "classfield", False):
+                    prepared_content[k] = fields[k] = v
+                    continue
+
+                # Create independent copy
+                field_copy = v.copy()
+                field_copy.name = k
+                field_copy.data = self  # <- link copied field, not original
+                prepared_content[k] = fields[k] = field_copy
+            
+            for k, v in kwargs.items():
+                prepared = prepared_content.get(k, None)
+                if isinstance(prepared, Field) and not isinstance(prepared, ComputedField):
+                    prepared.value = v
+                    continue
                 prepared_content[k] = v
-                continue
-
-            # Create independent copy
-            field_copy = v.copy()
-            field_copy.name = k
-            field_copy.data = self  # <- link copied field, not original
-            prepared_content[k] = field_copy
-        
-        for k, v in kwargs.items():
-            prepared = prepared_content.get(k, None)
-            if isinstance(prepared, Field) and not isinstance(prepared, ComputedField):
-                prepared.value = v
-                continue
-            prepared_content[k] = v
-
-        # Core attributes
-        object.__setattr__(self, "annotations", {})
-        object.__setattr__(self, "content", prepared_content)
-        object.__setattr__(self, "_meta_cache", {}) # Create a _meta_cache for this object
-
-        try:
-            meta_cls = dict(type(self).__meta_config__)
-        except AttributeError:
-            meta_cls = {}
-        object.__setattr__(self, "__meta_config__", meta_cls)
-
-        # Config flags
-        object.__setattr__(self, "__frozen__", frozen or self.meta.get("frozen", False))
-        object.__setattr__(self, "__auto_cast__", auto_cast or self.meta.get("auto_cast", False))
-        object.__setattr__(self, "__strict_typing__", strict_typing or self.meta.get("strict_typing", False))
+                if isinstance(v, Field):
+                    fields[k] = v
+                else:
+                    fields.pop(k, None)
+
+        # Core attributes (slot setters are bound below the class)
+        _set_annotations(self, {})
+        _set_content(self, prepared_content)
+        _set_content_cache(self, None)
+        _set_hash_cache(self, None)
+        _set_revision(self, 0) # Bumped on every write, lets cached computed fields spot stale results
+        _set_validation_cache(self, None) # Only filled by validate_data(..., cached=True)
+        _set_meta_cache(self, None) # Merged lazily by the meta property
+        _set_original(self, None) # Rollback copy, only taken inside a with-block
+        _set_outer_blocks(self, None) # Rollback states of enclosing with-blocks on this instance
+
+        # Config flags: without an instance "__meta_config__" they come straight from the class,
+        # leaving the merged dict unbuilt until something reads meta
+        meta = type(self).__meta_config__ if "__meta_config__" not in prepared_content else self.meta
+        _set_frozen(self, frozen or meta.get("frozen", False))
+        _set_auto_cast(self, auto_cast or meta.get("auto_cast", False))
+        _set_strict_typing(self, strict_typing or meta.get("strict_typing", False))
 
         # Field registry (now fields are already linked)
-        object.__setattr__(self, "__fields__", {k: v for k, v in prepared_content.items() if isinstance(v, Field)})
+        _set_fields(self, fields)
     
     @property
     def meta(self) -> Dict[str, Any]:
         """Allocate and retrieve relevant metadata for the Data object."""
-        cls_meta = self.__class__.__meta_config__ or {}
-        instance_meta = self.content.get("__meta_config__", {})
-        merged = {}
-        merged.update(cls_meta)
-        merged.update(instance_meta)
-        object.__setattr__(self, "_meta_cache", merged)
-        return object.__getattribute__(self, "_meta_cache")
+        merged = self._meta_cache
+        if merged is None:
+            # Only rebuilt after the instance's own "__meta_config__" entry changes
+            cls_meta = self.__class__.__meta_config__ or {}
+            instance_meta = self.content.get("__meta_config__", {})
+            merged = {**cls_meta, **instance_meta}
+            _set_meta_cache(self, merged)
+        return merged
     
     @property
     def data(self) -> Dict[str, Any]:
@@ -95,237 +319,198 @@ class Data(Generic[V], Iterable, metaclass=DataMeta):
     @property
     def fields(self) -> Dict[str, Field]:
         self.__link_fields__()
-        return object.__getattribute__(self, "__fields__")
+        return self.__fields__
     
     def __link_fields__(self):
         """Ensure all Field objects are linked to this Data instance."""
         object.__setattr__(self, "__fields__", {})
-        for name, field in object.__getattribute__(self, "content").items():
+        for name, field in self.content.items():
             if isinstance(field, Field):
-                object.__getattribute__(self, "__fields__")[name] = field
+                self.__fields__[name] = field
                 field.name = name
                 field.data = self
     
     def __check_type(self, value: Any, annotation: Type) -> bool:
-        """Recursively checks if a value conforms to a given typing annotation."""
-        origin = get_origin(annotation)
-        args = get_args(annotation)
-
-        # 1. Handle Field objects (Initial value resolution)
+        """Checks if a value conforms to a given typing annotation."""
+        # Resolve Field objects to their value or default first
         if isinstance(value, Field):
-            # Your existing logic to resolve Field to its value or default
-            field = value
-            value = field.value
-            if value is None:
-                if field.required:
-                    return False
-                value = field.default
-                # If default is still None, proceed to check annotation for Optional/None
-
-        # --- Core Type Logic ---
-
-        # 2. Handle Simple/Non-Generic Types (origin is None)
-        if origin is None:
-            if annotation is Any or isinstance(annotation, TypeVar): 
-                return True
-            if annotation is type(None): # Handles explicit 'type(None)' annotation
-                return value is None
-            
-            # Handle custom Data subclasses here for instance checks
-            if isinstance(value, Data): 
-                return isinstance(value, annotation) 
-
-            # Handle built-in and simple classes (int, str, custom classes)
-            try:
-                return isinstance(value, annotation)
-            except TypeError:
-                # Catch cases where annotation is not a valid class (e.g., Literal, type(None) from get_args)
-                return True 
-
-        # --- Generic Type Logic ---
-
-        # 3. Handle Union (including Optional)
-        if origin is Union:
-            # Optimization: Optional[T] is Union[T, NoneType]
-            if type(None) in args and value is None:
-                return True
-            
-            # Check if value matches any type in the Union
-            return any(self.__check_type(value, arg) for arg in args)
-
-        # 4. Handle Literal
-        if origin is Literal:
-            # Check if the value is one of the literal arguments
-            return value in args
-
-        # 5. Handle Callable
-        if origin is Callable:
-            if not callable(value):
-                return False
-            # Note: Checking signature is complex, usually just check if callable
-            return True
-        
-        # 6. Handle Type/type (Type[T] or type[T])
-        if origin is Type or origin is type:
-            if not isinstance(value, type):
-                return False
-            if args:
-                # Check if the class/type is a subclass of the annotated generic argument
-                # e.g., value is a class, args[0] is the base class T
-                target_class = args[0]
-                if get_origin(target_class) is Union:
-                    return any(issubclass(value, t) for t in get_args(target_class))
-                return issubclass(value, target_class)
-            return True # Type is generic (Type[Any])
-
-        # 7. Handle Container Types (List, Dict, Tuple, Set, etc.)
-        if origin in (list, List, set, Set, frozenset, FrozenSet):
-            if not isinstance(value, origin):
-                return False
-            
-            if args: # Annotated type (e.g., List[int])
-                item_type = args[0]
-                return all(self.__check_type(item, item_type) for item in value)
-            return True # Non-annotated type (e.g., List)
-            
-        if origin in (tuple, Tuple):
-            if not isinstance(value, origin):
-                return False
-                
-            if args: # Annotated tuple (e.g., Tuple[int, str] or Tuple[int, ...])
-                if len(args) == 2 and get_origin(args[1]) is Ellipsis: # Variable length Tuple[T, ...]
-                    item_type = args[0]
-                    return all(self.__check_type(item, item_type) for item in value)
-                
-                # Fixed-length tuple (e.g., Tuple[int, str])
-                if len(value) != len(args):
-                    return False 
-                return all(self.__check_type(value[i], args[i]) for i in range(len(value)))
-            return True # Non-annotated tuple (e.g., tuple)
-
-        if origin in (dict, Dict):
-            if not isinstance(value, origin):
+            value = _field_check_value(value)
+            if value is _MISSING:
                 return False
-                
-            if len(args) == 2: # Annotated dictionary (e.g., Dict[str, int])
-                key_type, value_type = args
-                return all(self.__check_type(k, key_type) and self.__check_type(v, value_type)
-                        for k, v in value.items())
-            return True # Non-annotated dictionary (e.g., Dict)
 
-        # --- Fallback for Subclasses ---
-
-        # 8. Fallback for Generic Subclasses (like Data[Gene])
-        try:
-            # Check if value is an instance of the non-generic origin type
-            if not isinstance(value, origin):
-                return False
-            
-            # Further checks for generics like Data[V] (optional, complex)
-            # If the origin has type arguments (args), you'd need custom logic 
-            # to ensure the instance's type arguments match the annotation's.
-            return True
-
-        except TypeError: 
-            # General catch-all for remaining types that are not usable with isinstance
-            return True
-
-        return False
+        if type(annotation) is type:
+            # Plain classes (int, str, user classes) need no compiled checker
+            return isinstance(value, annotation)
+        return _get_check(annotation)(value)
 
     def __get_incorrect_typing__(self, annotations: Optional[Dict[str, Type]] = None) -> List[str]:
-        annotations = annotations or object.__getattribute__(self, "annotations")
+        annotations = annotations or self.annotations
         if not annotations:
             return []
-            
-        incorrect: List[str] = []
-        content = object.__getattribute__(self, "content")
-        
-        for k, annotation in annotations.items():
-            if k not in content:
-                continue 
-
-            value = content[k]
-            if not self.__check_type(value, annotation):
-                incorrect.append(k)
-
-        return incorrect
+        content = self.content
+        # Dataclasses keep a generated validator for their class-level annotations (see _class_layout)
+        cached = type(self).__dict__.get("__dataclass_validator__")
+        if cached is not None and cached[0] == annotations:
+            return cached[1](content)
+        # Annotations patched on the instance are checked key by key, instead of generating code per set
+        check_type = self.__check_type
+        return [key for key, annotation in annotations.items()
+                if key in content and not check_type(content[key], annotation)]
 
     def __raise_typing_error__(self) -> None:
-        annotations = object.__getattribute__(self, "annotations")
+        annotations = self.annotations
         if not annotations:
             return
         incorrect = []
-        if object.__getattribute__(self, "__strict_typing__"):
+        if self.__strict_typing__:
             incorrect = self.__get_incorrect_typing__(annotations)
-        for name, field in object.__getattribute__(self, "__fields__").items():
-            if not isinstance(field, ComputedField) and (not field.validator(field.value or field.default) or (field.required and not field.value)):
+        for name, field in self.__fields__.items():
+            if _invalid_field(field):
                 if not name in incorrect: incorrect.append(name)
         if incorrect:
             raise TypeError(f"Incorrect typing for fields: {', '.join(incorrect)}")
     
+    def __validate_key__(self, key: str) -> None:
+        """Validate a single written key, instead of sweeping every annotation and field."""
+        self.__validate_keys__((key,))
+    
+    def __validate_keys__(self, keys: Iterable[str]) -> None:
+        """Validate several written keys, reporting every failing one in a single error."""
+        annotations = self.annotations
+        if not annotations:
+            return
+        content = self.content
+        fields = self.__fields__
+        strict = self.__strict_typing__
+        incorrect: List[str] = []
+        for key in keys:
+            if (strict and key in annotations and key in content
+                    and not self.__check_type(content[key], annotations[key])):
+                incorrect.append(key)
+                continue
+            field = fields.get(key)
+            if field is not None and _invalid_field(field):
+                incorrect.append(key)
+        if incorrect:
+            raise TypeError(f"Incorrect typing for fields: {', '.join(incorrect)}")
+    
     def _resolve_value(self, value: Any) -> V:
+        if type(value) in _PLAIN_TYPES:
+            return value
         if isinstance(value, Field):
-            return (value.value or value.default) if not isinstance(value, ComputedField) else value.value
+            if isinstance(value, ComputedField):
+                return value.value
+            # Only fall back to the default when unset, so 0/""/False survive
+            resolved = value.value
+            return resolved if resolved is not None else value.default
         if isinstance(value, Data):
             return value.get_content()
         return value
     
+    def __resolved__(self) -> DictSchema:
+        """Return the resolved content, reusing the cached dict while it is still valid. Do not mutate the result."""
+        cache = self._content_cache
+        if cache is not None:
+            return cache
+        resolved = {}
+        cacheable = True
+        resolve = self._resolve_value
+        dynamic = (Field, Data)
+        plain = _PLAIN_TYPES
+        for k, v in self.content.items():
+            if type(v) not in plain and isinstance(v, dynamic):
+                # Fields and nested Data can change behind our back, so never cache them
+                cacheable = False
+                v = resolve(v)
+            resolved[k] = v
+        # Like the hash, only frozen data keeps it: mutable content may be written directly (data.content[k] = v)
+        if cacheable and self.__frozen__:
+            object.__setattr__(self, "_content_cache", resolved)
+        return resolved
+    
+    def __invalidate__(self, key: Optional[str] = None) -> None:
+        """Drop the resolved content and hash caches before a mutation, and the merged meta if `key` is its source."""
+        if self.__original__ is _COPY_ON_WRITE:
+            # First write inside a with-block: take the rollback copy now
+            _set_original(self, self.content.copy())
+        _set_content_cache(self, None)
+        _set_hash_cache(self, None)
+        _set_revision(self, self._revision + 1)
+        if key == "__meta_config__":
+            _set_meta_cache(self, None)
+    
     def get_content(self) -> DictSchema:
-        return {k: self._resolve_value(v) for k, v in object.__getattribute__(self, "content").items()}
+        return dict(self.__resolved__())
     
     def snapshot(self, version: Optional[str] = None) -> "FrozenData[V]":
-        frozen = FrozenData(self.to_dict())
-        frozen.__meta_config__["version"] = version or "snapshot"
+        frozen = FrozenData(self.get_content())
+        frozen.meta["version"] = version or "snapshot"
         return frozen
     
     def copy(self) -> "Data[V]":
         """Creates a shallow copy of the Data object."""
-        return type(self)(**object.__getattribute__(self, "content").copy())
+        cls = type(self)
+        content = self.content
+        if self.__fields__ or cls.__init__ not in _COPYABLE_INITS:
+            # Fields need fresh copies linked to the new owner, and other __init__s (like a dataclass's,
+            # which re-adds class defaults and validates) must run
+            return cls(**content.copy())
+        # These initializers neither validate nor add defaults, so the content can be taken as is.
+        # Like the constructor path, the copy starts without the source's (e.g. patched) annotations.
+        new = cls.__new__(cls)
+        Data.__init__(new, content.copy(), frozen=isinstance(self, FrozenData))
+        return new
     
     @classmethod
     def from_dict(cls: Type["Data[V]"], data: DictSchema) -> "Data[V]":
         """Creates a Data object from a dictionary."""
         return cls(data)
     
-    def to_dict(self) -> Union[DictSchema, FrozenSet]:
-        """Converts the Data object to a standard dictionary."""
-        content = dict(self.get_content())
-        if object.__getattribute__(self, "__frozen__"):
-            return frozenset(content)
-        return content
+    def to_dict(self) -> Union[DictSchema, Mapping[str, V]]:
+        """Converts the Data object to a standard dictionary (a read-only view when frozen)."""
+        if self.__frozen__:
+            # The proxy keeps callers from mutating the cached dict, so no copy is needed
+            return MappingProxyType(self.__resolved__())
+        return dict(self.__resolved__())
 
     @classmethod
     def from_json(cls, s: str) -> "Data":
+        import json # Deferred: json (and re) are only needed by the JSON helpers
         return cls.from_dict(json.loads(s))
     
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent)
+        import json
+        # dumps only reads, so the cached resolved dict can be serialised without a copy
+        return json.dumps(self.__resolved__(), indent=indent)
     
     @classmethod
     def from_env(cls: Type["Data"], prefix: str = "") -> "Data":
         """Load Data fields from environment variables."""
+        environ = os.environ
         data = {}
         for k in cls.__annotations__:
-            env_key = f"{prefix}{k}".upper()
-            if env_key in os.environ:
-                data[k] = os.environ[env_key]
+            value = environ.get(f"{prefix}{k}".upper()) # One lookup: environment values are never None
+            if value is not None:
+                data[k] = value
         return cls(data)
 
     @classmethod
     def from_file(cls: Type["Data"], path: str) -> "Data":
         """Load a Data instance from a JSON file."""
-        with open(path, "r") as f:
-            return cls.from_dict(json.load(f))
+        import json
+        # json.loads detects the UTF encoding of raw bytes itself, skipping the text layer
+        with open(path, "rb") as f:
+            return cls.from_dict(json.loads(f.read()))
     
     def keys(self) -> KeysView[str]:
         """Return a set-like object providing a view on the data's keys."""
-        return object.__getattribute__(self, "content").keys()
+        return self.content.keys()
     def values(self) -> ValuesView[V]:
         """Return a set-like object providing a view on the data's values."""
-        return self.get_content().values()
+        return self.__resolved__().values()
     def items(self) -> ItemsView[str, V]:
         """Return a set-like object providing a view on the data's items."""
-        return self.get_content().items()
+        return self.__resolved__().items()
     
     @overload
     def get(self, key: str, default: Literal[None] = None) -> Optional[V]: ...
@@ -333,23 +518,22 @@ class Data(Generic[V], Iterable, metaclass=DataMeta):
     def get(self, key: str, default: V) -> V: ...
     def get(self, key: str, default: Optional[V] = None) -> Optional[V]:
         """Return the value for key if key is in the dictionary, else default."""
-        return self._resolve_value(object.__getattribute__(self, "content").get(key, default))
+        return self._resolve_value(self.content.get(key, default))
     
     @overload
     def setdefault(self, key: str, default: Literal[None] = None) -> Optional[V]: ...
     @overload
     def setdefault(self, key: str, default: V) -> V: ...
     def setdefault(self, key: str, default: Optional[V] = None) -> Optional[V]:
-        content = object.__getattribute__(self, "content")
-        if object.__getattribute__(self, "__frozen__"):
+        content = self.content
+        if self.__frozen__:
             return content.get(key, default)
         if not key in content:
             if isinstance(default, Field):
-                object.__getattribute__(self, "__fields__")[key] = default
+                self.__fields__[key] = default
             result = self._resolve_value(default)
             self.__setitem__(key, default)
         result = self.__getitem__(key)
-        self.__raise_typing_error__()
         return result
     
     @overload
@@ -363,29 +547,32 @@ class Data(Generic[V], Iterable, metaclass=DataMeta):
         If the key is not found, return the default if given; otherwise,
         raise a KeyError.
         """
-        content = object.__getattribute__(self, "content")
-        if object.__getattribute__(self, "__frozen__"):
+        content = self.content
+        if self.__frozen__:
             return content.get(key, default)
         if isinstance(content.get(key, None), Field):
-            object.__getattribute__(self, "__fields__").pop(key, None)
+            self.__fields__.pop(key, None)
+        self.__invalidate__(key)
         return content.pop(key, self._resolve_value(default))
     
     def update(self, data: Union["Data", DictSchema]) -> None:
-        if object.__getattribute__(self, "__frozen__"):
+        if self.__frozen__:
             return
-        for k, v in data.items():
-            self.__setitem__(k, v)
-        self.__raise_typing_error__()
+        written = self.__store_many__(data.items(), "__meta_config__" in data)
+        # Validate the written keys once after all writes (and not at all for untyped data)
+        if self.annotations:
+            self.__validate_keys__(written)
     
     def clear(self) -> None:
-        if object.__getattribute__(self, "__frozen__"):
+        if self.__frozen__:
             return
-        object.__getattribute__(self, "__fields__").clear()
-        object.__getattribute__(self, "content").clear()
+        self.__invalidate__("__meta_config__")
+        self.__fields__.clear()
+        self.content.clear()
     
     def __call__(self, key: str, /, *args: Any, **kwargs: Any) -> Any:
         """Calls a callable stored in the data with the given key, passing any additional arguments."""
-        value = object.__getattribute__(self, "content").get(key)
+        value = self.content.get(key)
         if isinstance(value, ComputedField):
             value = lambda: value.value
         if not callable(value): 
@@ -393,76 +580,140 @@ class Data(Generic[V], Iterable, metaclass=DataMeta):
         return value(*args, **kwargs)
     
     def __getattr__(self, name: str) -> V:
-        content = object.__getattribute__(self, "content")
-        if name in content:
-            return self._resolve_value(content[name])
-        raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
+        # Not self.content: an unset slot (e.g. mid-unpickle) would re-enter __getattr__
+        value = _get_content(self).get(name, _MISSING)
+        if value is not _MISSING:
+            return self._resolve_value(value)
+        raise AttributeError(f"{type(self).__repr_prefix__} has no attribute '{name}'")
     
     def __setattr__(self, name: str, value: V) -> None:
         self.__setitem__(name, value)
     
     def __enter__(self) -> "Data":
-        object.__setattr__(self, "__original__", object.__getattribute__(self, "content").copy())
-        object.__setattr__(self, "__was_frozen__", object.__getattribute__(self, "__frozen__"))
-        object.__setattr__(self, "__frozen__", False)
+        if self.__original__ is not None:
+            # Re-entered: keep the enclosing block's rollback state until this one exits
+            _set_outer_blocks(self, (self.__original__, self.__was_frozen__, self.__outer_blocks__))
+        # The content is only copied once the block actually writes (see __invalidate__)
+        _set_original(self, _COPY_ON_WRITE)
+        _set_was_frozen(self, self.__frozen__)
+        _set_frozen(self, False)
         return self
     
-    def __exit__(self, *args: Any) -> None:
-        if any(args):
-            object.__setattr__(self, "content", object.__getattribute__(self, "__original__"))
-        object.__setattr__(self, "__frozen__", object.__getattribute__(self, "__was_frozen__"))
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Any) -> None:
+        original = self.__original__
+        _set_original(self, None)
+        if exc_type is not None and type(original) is dict:
+            _set_content(self, original)
+            self.__invalidate__("__meta_config__")
+            original = _COPY_ON_WRITE # Rolled back, so nothing is written since the block began
+        _set_frozen(self, self.__was_frozen__)
+        outer = self.__outer_blocks__
+        if outer is not None:
+            outer_original, was_frozen, outer = outer
+            if outer_original is _COPY_ON_WRITE:
+                # The enclosing block had not written before this one, so this block's copy is its state too
+                outer_original = original
+            _set_original(self, outer_original)
+            _set_was_frozen(self, was_frozen)
+            _set_outer_blocks(self, outer)
     
     def __getitem__(self, key: str) -> V:
-        return self._resolve_value(object.__getattribute__(self, "content")[key])
+        return self._resolve_value(self.content[key])
     def __setitem__(self, key: str, value: V) -> None:
-        content = object.__getattribute__(self, "content")
-        if object.__getattribute__(self, "__frozen__"):
+        if self.__frozen__:
             return
-        if object.__getattribute__(self, "__auto_cast__"):
-            expected = self.annotations.get(key)
-            if expected:
-                try:
-                    value = expected(value)
-                except Exception:
-                    pass
-        if isinstance(value, Field):
-            object.__getattribute__(self, "__fields__")[key] = value
-            content[key] = value
-        elif isinstance(content[key], Field) and not isinstance(content[key], ComputedField):
-            content[key].value = value
-        else: content[key] = value
-        self.__raise_typing_error__()
+        self.__store__(key, value)
+        if self.annotations:
+            self.__validate_key__(key)
+    def __store__(self, key: str, value: V) -> None:
+        """Write a value without validating it. Callers check frozen state and validate."""
+        self.__store_many__(((key, value),), key == "__meta_config__")
+    def __store_many__(self, items: Iterable[Tuple[str, V]], meta_changed: bool = False) -> List[str]:
+        """Write several values without validating them, invalidating once and hoisting the per-instance lookups. Returns the written keys."""
+        self.__invalidate__("__meta_config__" if meta_changed else None)
+        content = self.content
+        fields = self.__fields__
+        annotations = self.annotations if self.__auto_cast__ else None
+        written: List[str] = []
+        for key, value in items:
+            if annotations:
+                expected = annotations.get(key)
+                if expected:
+                    try:
+                        value = expected(value)
+                    except Exception:
+                        pass
+            current = content.get(key)
+            if isinstance(value, Field):
+                fields[key] = value
+                content[key] = value
+            elif isinstance(current, Field) and not isinstance(current, ComputedField):
+                current.value = value
+            else: content[key] = value
+            written.append(key)
+        return written
     def __delitem__(self, key: str) -> None:
-        if object.__getattribute__(self, "__frozen__"):
+        if self.__frozen__:
             return
-        if key in object.__getattribute__(self, "__fields__"):
-            del object.__getattribute__(self, "__fields__")[key]
-        del object.__getattribute__(self, "content")[key]
+        self.__invalidate__(key)
+        if key in self.__fields__:
+            del self.__fields__[key]
+        del self.content[key]
     def __contains__(self, key: str) -> bool:
-        return key in object.__getattribute__(self, "content")
+        return key in self.content
     def __eq__(self, other: Union[Any, "Data"]) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Data):
-            return (object.__getattribute__(self, "content") == 
-                    object.__getattribute__(other, "content"))
-        if isinstance(other, dict):
-            return object.__getattribute__(self, "content") == other
-        return NotImplemented
+            other = other.content
+        elif not isinstance(other, dict):
+            return NotImplemented
+        content = self.content
+        # Differently sized contents can never be equal
+        return len(content) == len(other) and content == other
     def __iter__(self):
-        return iter(object.__getattribute__(self, "content"))
+        return iter(self.content)
     def __len__(self) -> int:
-        return len(object.__getattribute__(self, "content"))
+        return len(self.content)
     def __repr__(self) -> str:
-        items = ", ".join(f"{k}={v!r}" for k, v in self.items() if not k.startswith("_") and not callable(v))
-        return f"{type(self).__name__}({items})" if items else f"{type(self).__name__}()"
+        items = ", ".join([f"{k}={v!r}" for k, v in self.__resolved__().items() if k[:1] != "_" and not callable(v)])
+        return f"{type(self).__repr_prefix__}({items})"
     def __str__(self) -> str:
-        return str(object.__getattribute__(self, "content"))
+        return str(self.content)
     def __hash__(self) -> int:
-        return hash(frozenset(object.__getattribute__(self, "content").items()))
+        h = self._hash_cache
+        if h is not None:
+            return h
+        content = self.content
+        h = hash(frozenset(content.items()))
+        # Only frozen data keeps its hash (writes inside a with-block still clear it in __invalidate__).
+        # Nested Data can change without telling us, so those are always rehashed.
+        if self.__frozen__ and not any(isinstance(v, Data) for v in content.values()):
+            _set_hash_cache(self, h)
+        return h
+
+# Slot descriptor accessors, skipping the attribute lookup object.__getattribute__/__setattr__ do on every call.
+# Subclasses must not redeclare Data's slots, or these would write to shadowed storage.
+_get_content = Data.content.__get__
+_set_annotations = Data.annotations.__set__
+_set_content = Data.content.__set__
+_set_content_cache = Data._content_cache.__set__
+_set_hash_cache = Data._hash_cache.__set__
+_set_revision = Data._revision.__set__
+_set_validation_cache = Data._validation_cache.__set__
+_set_meta_cache = Data._meta_cache.__set__
+_set_frozen = Data.__frozen__.__set__
+_set_auto_cast = Data.__auto_cast__.__set__
+_set_strict_typing = Data.__strict_typing__.__set__
+_set_fields = Data.__fields__.__set__
+_set_original = Data.__original__.__set__
+_set_was_frozen = Data.__was_frozen__.__set__
+_set_outer_blocks = Data.__outer_blocks__.__set__
 
 class FrozenData(Data):
     """Frozen Data is completely immutable and cannot be changed."""
 
-    __slots__ = Data.__slots__ + ("__weakref__",)
+    __slots__ = ("__weakref__",)
 
     def __init__(self, value: Optional[DictSchema] = None, include_methods: bool = False, **kwargs: Any) -> None:
         super().__init__(value=value, frozen=True, include_methods=include_methods, **kwargs)
@@ -477,4 +728,7 @@ class FrozenData(Data):
     def __exit__(self, *args: Any) -> None: return
     def __setitem__(self, key: str, value: Any) -> None:
         raise AttributeError(f"Cannot modify frozen data: '{key}'")
-    def __delitem__(self, key: str) -> None: return
\ No newline at end of file
+    def __delitem__(self, key: str) -> None: return
+
+# Initializers that only build state from content, so copy() may bypass them
+_COPYABLE_INITS: Set[Callable[..., None]] = {Data.__init__, FrozenData.__init__}
\ No newline at end of file
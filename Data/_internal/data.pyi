@@ -1,7 +1,7 @@
 from typing import (
     Iterable, Dict, List, Any, Optional, Type, TypeVar, Generic, 
     Literal, overload, KeysView, ValuesView, ItemsView, Union,
-    FrozenSet
+    Mapping, Tuple
 )
 from .meta import DataMeta
 from .fields import Field
@@ -23,12 +23,16 @@ class Data(Generic[V], Iterable, metaclass=DataMeta):
     def __check_type(self, value: Any, annotation: Type) -> bool: ...
     def __get_incorrect_typing__(self) -> List[str]: ...
     def __raise_typing_error__(self) -> None: ...
+    def __validate_key__(self, key: str) -> None: ...
+    def __validate_keys__(self, keys: Iterable[str]) -> None: ...
     def _resolve_value(self, value: Any) -> V: ...
+    def __resolved__(self) -> DictSchema: ...
+    def __invalidate__(self, key: Optional[str] = None) -> None: ...
     def get_content(self) -> DictSchema: ...
     def copy(self) -> "Data[V]": ...
     @classmethod
     def from_dict(cls: Type["Data[V]"], data: DictSchema) -> "Data[V]": ...
-    def to_dict(self) -> Union[DictSchema, FrozenSet]: ...
+    def to_dict(self) -> Union[DictSchema, Mapping[str, V]]: ...
     @classmethod
     def from_json(cls, s: str) -> "Data": ...
     def to_json(self, indent: int = 2) -> str: ...
@@ -57,12 +61,13 @@ class Data(Generic[V], Iterable, metaclass=DataMeta):
     def update(self, data: DictSchema) -> None: ...
     def clear(self) -> None: ...
     def __call__(self, key: str, *args: Any, **kwargs: Any) -> Any: ...
-    def __getattribute__(self, name: str) -> Any: ...
     def __setattr__(self, name: str, value: Any) -> None: ...
     def __enter__(self) -> "Data": ...
-    def __exit__(self, *args: Any) -> None: ...
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Any) -> None: ...
     def __getitem__(self, key: str) -> V: ...
     def __setitem__(self, key: str, value: V) -> None: ...
+    def __store__(self, key: str, value: V) -> None: ...
+    def __store_many__(self, items: Iterable[Tuple[str, V]], meta_changed: bool = False) -> List[str]: ...
     def __delitem__(self, key: str) -> None: ...
     def __contains__(self, key: str) -> bool: ...
     def __eq__(self, other: Union[object, "Data"]) -> bool: ...
@@ -1,35 +1,63 @@
-from typing import TypeVar, Optional, Any, Type
-from .data import Data
+from typing import TypeVar, Optional, Any, Type, Dict, Tuple
+from .data import Data, DictSchema, _set_annotations, _annotations_of, _compile_validator
+from .meta import DataMeta
 
 T = TypeVar("T", bound=Data)
 
+# Names owned by the Data base classes, never treated as dataclass content
+_DATA_KEYS = frozenset(k for c in Data.__mro__ for k in c.__dict__ if k not in ("__dict__", "__weakref__"))
+
 class _Dataclass(Data):
     
-    __slots__ = Data.__slots__ + ("__weakref__",)
+    __slots__ = ("__weakref__",)
 
     def __init__(self, **kwargs: Any) -> None:
-        cls = type(self)
+        defaults, annotations = _class_layout(type(self))
+        super().__init__(value={**defaults, **kwargs})
+        _set_annotations(self, annotations)
+        self.__raise_typing_error__()
 
-        data_keys = set(k for c in Data.__mro__ for k in c.__dict__ if k not in ("__dict__", "__weakref__"))
+# Classes whose attributes are only written through DataMeta (or never), so DataMeta.__generation__ tracks them
+_TRACKED_BASES = frozenset(Data.__mro__)
 
-        instance_content = {}
-        for base in reversed(cls.__mro__):
+def _class_layout(cls: Type[Data]) -> Tuple[DictSchema, Dict[str, Any]]:
+    """
+    Collect the class-level defaults and merged annotations of a dataclass.
+
+    The defaults' MRO walk runs once per class and is kept on the class until any
+    Data class attribute is written (see DataMeta.__generation__). Classes with
+    other bases are walked every time, since writes to those bump no generation.
+    The annotations are always merged afresh, so in-place edits are picked up,
+    and their generated validator is kept on the class alongside.
+    """
+    generation = DataMeta.__generation__
+    mro = cls.__mro__
+    layout = cls.__dict__.get("__dataclass_layout__")
+    if layout is not None and layout[0] == generation:
+        defaults = layout[1]
+    else:
+        data_keys = _DATA_KEYS
+        defaults = {}
+        for base in reversed(mro):
             base_dict = getattr(base, '__dict__', {})
             for k, v in base_dict.items():
                 if k.startswith("_") or k in data_keys or callable(v):
                     continue
-                instance_content[k] = v
-
-        instance_content.update(kwargs)
-
-        super().__init__(value=instance_content)
-
-        anns: dict[str, Any] = {}
-        for base in reversed(cls.__mro__):
-            anns.update(getattr(base, "__annotations__", {}))
-
-        object.__setattr__(self, "annotations", anns)
-        self.__raise_typing_error__()
+                defaults[k] = v
+        if all(isinstance(base, DataMeta) or base in _TRACKED_BASES for base in mro):
+            # type.__setattr__ so storing the cache does not itself bump the generation
+            type.__setattr__(cls, "__dataclass_layout__", (generation, defaults))
+
+    annotations: Dict[str, Any] = {}
+    for base in reversed(mro):
+        annotations.update(_annotations_of(base))
+
+    # The generated validator for these annotations, regenerated only once they change.
+    # Replaced as one tuple, so concurrent readers never see a validator for other annotations.
+    validator = cls.__dict__.get("__dataclass_validator__")
+    if validator is None or validator[0] != annotations:
+        type.__setattr__(cls, "__dataclass_validator__", (dict(annotations), _compile_validator(annotations)))
+    return defaults, annotations
 
 def data_factory(
     cls: Optional[Type[T]] = None, /,
@@ -54,6 +82,10 @@ def data_factory(
         namespace = dict(cls.__dict__)
         namespace["__module__"] = cls.__module__
         namespace["__qualname__"] = cls.__qualname__
+        # Writes go to content, so instances need no __dict__: stay slotted like Data itself
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        namespace.setdefault("__slots__", ())
 
         config = getattr(cls, "__meta_config__", {}).copy()
         config.update(kwargs)
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Callable, Type, Any
+from typing import TYPE_CHECKING, Callable, Type, Any, Set, Tuple
+from threading import get_ident
 if TYPE_CHECKING:
     from factory import T
     from data import V
@@ -6,7 +7,15 @@ if TYPE_CHECKING:
 if TYPE_CHECKING:
     ValidatorLike = Callable[[V], Any]
 
+# (thread id, field id) pairs whose method is currently being evaluated
+_ACTIVE: Set[Tuple[int, int]] = set()
+
+def _accept_all(value: Any) -> bool:
+    return True
+
 class Field:
+    __slots__ = ("name", "default", "default_factory", "validator", "required", "classfield", "data", "value")
+
     name: str
     default: Any
     default_factory: Type
@@ -15,7 +24,7 @@ class Field:
     if TYPE_CHECKING:
         validator: ValidatorLike
         data: T
-        _value: V
+        value: V
 
     def __init__(
         self, *, 
@@ -28,54 +37,74 @@ class Field:
         self.name = None
         self.default = default
         self.default_factory = default_factory
-        self.validator = validator or (lambda x: True)
+        self.validator = validator or _accept_all
         self.required = required
         self.classfield = classfield
         self.data = None
-        self._value = None
+        self.value = None
     
     def copy(self) -> "Field":
-        new_field = Field(default=self.default_factory() if self.default_factory else self.default, default_factory=self.default_factory, validator=self.validator, required=self.required)
+        # Every Data instance copies its class fields, so skip __init__ and fill the slots directly
+        new_field = Field.__new__(Field)
         new_field.name = self.name
+        new_field.default = self.default_factory() if self.default_factory else self.default
+        new_field.default_factory = self.default_factory
+        new_field.validator = self.validator
+        new_field.required = self.required
+        new_field.classfield = False
         new_field.data = self.data
+        new_field.value = None
         return new_field
-    
-    @property
-    def value(self) -> Any:
-        return self._value
-    
-    @value.setter
-    def value(self, new: Any) -> None:
-        self._value = new
 
 class ComputedField(Field):
+    __slots__ = ("method", "cached", "_cache", "_cache_revision")
+
     name: str
-    recursion: bool
     classfield: bool
+    cached: bool
     if TYPE_CHECKING:
         method: Callable[[T], V]
         data: T
 
-    def __init__(self, method, classfield: bool = False) -> None:
+    def __init__(self, method, classfield: bool = False, cached: bool = False) -> None:
         self.name = None
         self.method = method
         self.classfield = classfield
         self.data = None
-        self.recursion = False
+        self.cached = cached
+        self._cache = None
+        self._cache_revision = -1
     
     def copy(self) -> "ComputedField":
-        new_field = ComputedField(self.method, self.classfield)
+        new_field = ComputedField.__new__(ComputedField)
         new_field.name = self.name
+        new_field.method = self.method
+        new_field.classfield = self.classfield
         new_field.data = self.data
+        new_field.cached = self.cached
+        new_field._cache = None
+        new_field._cache_revision = -1
         return new_field
     
     @property
     def value(self) -> Any:
-        if not self.recursion:
-            self.recursion = True
+        if self.cached:
+            # Reuse the last result until the owning Data is written to (its revision changes)
+            revision = getattr(self.data, "_revision", -1)
+            if revision == self._cache_revision and revision != -1:
+                return self._cache
+        key = (get_ident(), id(self))
+        if key in _ACTIVE:
+            return None
+        _ACTIVE.add(key)
+        try:
             result = self.method(self.data)
-            self.recursion = False
-            return result
+        finally:
+            _ACTIVE.discard(key)
+        if self.cached:
+            self._cache = result
+            self._cache_revision = getattr(self.data, "_revision", -1)
+        return result
     
     @value.setter
     def value(self, new: Any) -> None:
@@ -91,5 +120,5 @@ def field(
 ) -> Field: 
     return Field(default=default, default_factory=default_factory, validator=validator, required=required, classfield=classfield)
 
-def computed_field(method, classfield: bool = False) -> ComputedField:
-    return ComputedField(method, classfield)
\ No newline at end of file
+def computed_field(method, classfield: bool = False, cached: bool = False) -> ComputedField:
+    return ComputedField(method, classfield, cached)
\ No newline at end of file
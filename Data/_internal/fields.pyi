@@ -18,7 +18,7 @@ class Field:
         ...
 
 class ComputedField(Field):
-    def __init__(self, method: Callable[[T], V], classfield: bool = False) -> None: ...
+    def __init__(self, method: Callable[[T], V], classfield: bool = False, cached: bool = False) -> None: ...
 
 def field(
     *, 
@@ -30,4 +30,4 @@ def field(
 ) -> Field: 
     ...
 
-def computed_field(method: Callable[[T], V], classfield: bool = False) -> ComputedField: ...
\ No newline at end of file
+def computed_field(method: Callable[[T], V], classfield: bool = False, cached: bool = False) -> ComputedField: ...
\ No newline at end of file
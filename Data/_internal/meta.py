@@ -1,12 +1,24 @@
-from typing import Dict, Any, Type
+from typing import Dict, Mapping, Any, Type
 from abc import ABCMeta
+from types import MappingProxyType
+from sys import intern
 
 __all__ = ("DataMeta",)
 
 class DataMeta(ABCMeta):
     """Metaclass to process configuration arguments at class definition time."""
-    __meta_config__: Dict[str, Any]
+    __meta_config__: Mapping[str, Any]
+    __repr_prefix__: str
+    __generation__: int = 0 # Bumped on every class attribute write, so per-class caches know to rebuild
     def __new__(mcs, name: str, bases: tuple[Type, ...], namespace: Dict[str, Any], **kwargs: Any) -> Type:
         new_cls = super().__new__(mcs, name, bases, namespace)
-        new_cls.__meta_config__ = dict(kwargs)
-        return new_cls
\ No newline at end of file
+        # Read-only, so instances and subclasses cannot edit the class configuration in place
+        new_cls.__meta_config__ = MappingProxyType({intern(k): v for k, v in kwargs.items()})
+        new_cls.__repr_prefix__ = name # A plain class attribute reads faster than type.__name__
+        return new_cls
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        DataMeta.__generation__ += 1
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        DataMeta.__generation__ += 1
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import List, Dict, Union, Type, TypeVar, Literal, Generic, Optional, Any, overload
 from .factory import data_factory, _Dataclass
 from .fields import Field, ComputedField
-from .data import Data, V
+from .data import Data, V, _MISSING, _set_validation_cache, _annotations_of
 
 __all__ = (
     "is_data_factory", 
@@ -76,16 +76,39 @@ def make_data_factory(
 
     return cls(value=value, **kwargs)
 
-def validate_data(data: "Data", strict: bool = False) -> List[str]:
+def validate_data(data: "Data", strict: bool = False, cached: bool = False) -> List[str]:
     """
     Gather invalid fields from annotations and raise them if stricit is active.
     Otherwise, this will just returns invalid fields.
+
+    With `cached`, the result is reused until the data is written to or its annotations change.
+    Values mutated in place (like appending to a list) are not noticed then.
     """
-    bad_fields = data.__get_incorrect_typing__()
+    if cached:
+        revision = data._revision
+        annotations = data.annotations
+        cache = data._validation_cache
+        if cache is not None and cache[0] == revision and cache[1] == annotations:
+            bad_fields = list(cache[2])
+        else:
+            bad_fields = data.__get_incorrect_typing__()
+            _set_validation_cache(data, (revision, dict(annotations), list(bad_fields)))
+    else:
+        bad_fields = data.__get_incorrect_typing__()
     if strict and bad_fields:
         raise TypeError(f"Invalid fields: {', '.join(bad_fields)}")
     return bad_fields
 
+def _field_defaults(cls: Type[Data]) -> Dict[str, Any]:
+    """The class-level values of a class's annotated fields (those without one are left out)."""
+    # Annotations are read at call time, so fields annotated after class creation are included
+    defaults = {}
+    for k in _annotations_of(cls):
+        value = getattr(cls, k, _MISSING) # One lookup instead of hasattr and getattr
+        if value is not _MISSING:
+            defaults[k] = value
+    return defaults
+
 def inspect_data(obj: Union[Type[Data], Data]) -> Dict[str, Any]:
     """
     Retrieve a detailed dictionary containing name and type annotiations.
@@ -94,58 +117,63 @@ def inspect_data(obj: Union[Type[Data], Data]) -> Dict[str, Any]:
     cls = obj if isinstance(obj, type) else type(obj)
     data = obj if isinstance(obj, Data) else None
     defaults = {}
-    for k in getattr(cls, "__annotations__", {}):
-        if not hasattr(cls, k):
-            continue
-        value = getattr(cls, k, None)
+    for k, value in _field_defaults(cls).items():
         defaults[k] = value if not isinstance(value, Field) else value.default if not isinstance(value, ComputedField) else "<ComputedField>"
     return {
         "name": cls.__name__,
-        "annotations": getattr(cls, "__annotations__", {}),
+        "annotations": _annotations_of(cls),
         "defaults": defaults,
         "values": data.to_dict() if data else None,
     }
 
 def patch_data(data: Data, *, validate: bool = True, **updates: V) -> None:
     """Will update data. Sets annotiations according to the fields."""
-    anns = getattr(data, "__annotations__", {})
-    anns.update({k: type(v) for k, v in updates.items()})
+    # The instance's own annotations, so patching never leaks into the class (or its other instances)
+    annotations = data.annotations
     for k, v in updates.items():
-        setattr(data, k, v)
+        # Unannotated while written, so auto-cast stores the object passed in instead of type(v)(v)
+        annotations.pop(k, None)
+        try:
+            setattr(data, k, v)
+        finally:
+            annotations[k] = type(v)
     if validate:
         data.__raise_typing_error__()
 
 def diff_data(a: Data, b: Data) -> Dict:
     "Retrieves fields that doesn't appear in the other's structure."
-    diffs = {}
-    for k, v in a.items():
-        if b.get(k) != v:
-            diffs[k] = (v, b.get(k))
-    return diffs
+    b_get = b.__resolved__().get
+    return {k: (v, b_get(k)) for k, v in a.__resolved__().items() if b_get(k) != v}
 
 def sync_data(target: Data, source: Data, *, overwrite: bool = False) -> None:
     """Copy missing or differing values from source to target."""
-    for k, v in source.items():
-        if overwrite or k not in target or target[k] != v:
-            setattr(target, k, v)
+    # Collect first: every write invalidates the target's resolved content
+    target_get = target.__resolved__().get
+    changes = [(k, v) for k, v in source.__resolved__().items() if overwrite or target_get(k, _MISSING) != v]
+    for k, v in changes:
+        setattr(target, k, v)
 
 def to_schema(cls: Type[Data]) -> Dict[str, Any]:
-    schema = {"type": "object", "properties": {}}
-    for k, v in getattr(cls, "__annotations__", {}).items():
-        schema["properties"][k] = {"type": v}
-    return schema
+    # Built fresh each call: callers may modify the result, and a copy of a cached schema costs as much
+    return {"type": "object", "properties": {k: {"type": v} for k, v in _annotations_of(cls).items()}}
 
 def diff_schema(a: Type[Data], b: Type[Data]) -> Dict[str, Dict[str, Any]]:
     """Compare field annotations between two Data types."""
     diffs = {}
-    for k, v in a.__annotations__.items():
-        if k not in b.__annotations__:
-            diffs[k] = {"only_in": a.__name__}
-        elif b.__annotations__[k] != v:
-            diffs[k] = {"a": v, "b": b.__annotations__[k]}
-    for k in b.__annotations__:
-        if k not in a.__annotations__:
+    a_annotations = _annotations_of(a)
+    b_annotations = _annotations_of(b)
+    a_get = a_annotations.get
+    b_get = b_annotations.get
+    # One pass over the union; the merged dict keeps a's order, then b's own keys, as before
+    for k in {**a_annotations, **b_annotations}:
+        v = a_get(k, _MISSING)
+        w = b_get(k, _MISSING)
+        if v is _MISSING:
             diffs[k] = {"only_in": b.__name__}
+        elif w is _MISSING:
+            diffs[k] = {"only_in": a.__name__}
+        elif v != w:
+            diffs[k] = {"a": v, "b": w}
     return diffs
 
 def clone(data: Data, **updates: V) -> Data:
@@ -157,10 +185,9 @@ def clone(data: Data, **updates: V) -> Data:
 
 def pretty_repr(data: Data) -> str:
     """Return a formatted string showing fields, types, and values."""
-    lines = []
-    annotations = object.__getattribute__(data, "annotations")
-    lines.append(f"<Data{f" \"{data.__class__.__name__}\"" if not data.__class__.__name__ == "Data" else ""} object>:")
-    for k, v in data.items():
-        t = annotations.get(k, type(v))
-        lines.append(f"  {k}: {t.__name__} = {v!r}")
+    annotations_get = (object.__getattribute__(data, "annotations") or {}).get
+    name = data.__class__.__name__
+    lines = [f"<Data{f" \"{name}\"" if not name == "Data" else ""} object>:"]
+    # Built by one comprehension and extended once, instead of growing by an append per field
+    lines += [f"  {k}: {annotations_get(k, type(v)).__name__} = {v!r}" for k, v in data.items()]
     return "\n".join(lines)